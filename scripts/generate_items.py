@@ -1,6 +1,11 @@
 import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BASE_DIR = "/Users/bblue/Dev/clicker-shipper/public/assets"
 
@@ -43,14 +48,17 @@ ROOT_ORDER = [
 
 def list_icons(type_name: str) -> list:
     folder = os.path.join(BASE_DIR, FOLDER_MAP[type_name])
-    files = [f for f in os.listdir(folder) if f.endswith(".png")]
     prefix = PREFIX_MAP[type_name]
-    pattern = re.compile(r"^" + re.escape(prefix) + r"(\d+)\.png$")
     icons = []
-    for file_name in files:
-        match = pattern.match(file_name)
-        if match:
-            icons.append((int(match.group(1)), file_name[:-4]))
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            file_name = entry.name
+            if not (file_name.startswith(prefix) and file_name.endswith(".png")):
+                continue
+            # isdecimal() accepts exactly what the old (\d+) pattern did.
+            number = file_name[len(prefix):-4]
+            if number.isdecimal() and entry.is_file(follow_symlinks=False):
+                icons.append((int(number), file_name[:-4]))
     icons.sort(key=lambda x: x[0])
     return [name for _, name in icons]
 
@@ -80,43 +88,67 @@ def make_nav_down(type_name: str, level: int, children: list) -> dict:
 
 
 def build_chain(type_name: str, icons: list, start_index: int = 1, level: int = 1) -> list:
-    if len(icons) <= 6:
-        return [make_leaf(type_name, icon, start_index + i) for i, icon in enumerate(icons)]
-
-    current = icons[:5]
-    remaining = icons[5:]
-    next_children = build_chain(type_name, remaining, start_index + 5, level + 1)
-    nav_down = make_nav_down(type_name, level, next_children)
-
-    items = [make_leaf(type_name, current[0], start_index)]
-    items.append(nav_down)
-    items.extend(make_leaf(type_name, current[i], start_index + i) for i in range(1, 5))
-    return items
+    # Each page holds five leaves plus a nav-down node; the last page holds up to six.
+    # Find the last page, then wrap pages from the back so no tail slices are copied.
+    total = len(icons)
+    offset = 0
+    while total - offset > 6:
+        offset += 5
+        level += 1
+
+    children = [make_leaf(type_name, icons[i], start_index + i) for i in range(offset, total)]
+    while offset > 0:
+        offset -= 5
+        level -= 1
+        nav_down = make_nav_down(type_name, level, children)
+        children = [make_leaf(type_name, icons[offset], start_index + offset)]
+        children.append(nav_down)
+        children.extend(make_leaf(type_name, icons[offset + i], start_index + offset + i) for i in range(1, 5))
+    return children
+
+
+def encode_json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+
+
+def make_root(type_name: str, skill_icon: str, name: str, desc: str, icons: list) -> dict:
+    return {
+        "id": f"nav_{type_name}_root",
+        "name": name,
+        "icon": skill_icon,
+        "description": desc,
+        "layers": [
+            {"texture": skill_icon, "depth": 3},
+            {"texture": "frame", "depth": 2},
+        ],
+        "children": build_chain(type_name, icons),
+    }
 
 
 def main() -> None:
-    items = []
-    total = 0
-    for type_name, skill_icon, name, desc in ROOT_ORDER:
-        icons = list_icons(type_name)
-        total += len(icons)
-        children = build_chain(type_name, icons)
-        items.append({
-            "id": f"nav_{type_name}_root",
-            "name": name,
-            "icon": skill_icon,
-            "description": desc,
-            "layers": [
-                {"texture": skill_icon, "depth": 3},
-                {"texture": "frame", "depth": 2},
-            ],
-            "children": children,
-        })
+    # Directory scans are I/O bound, so list every category folder concurrently.
+    with ThreadPoolExecutor(max_workers=len(ROOT_ORDER)) as executor:
+        icon_lists = list(executor.map(list_icons, [type_name for type_name, _, _, _ in ROOT_ORDER]))
+
+    items = [make_root(*root, icons) for root, icons in zip(ROOT_ORDER, icon_lists)]
+    total = sum(len(icons) for icons in icon_lists)
 
     out_path = "/Users/bblue/Dev/clicker-shipper/public/data/items.json"
-    with open(out_path, "w", encoding="utf-8") as output_file:
-        json.dump({"items": items}, output_file, indent=2)
-        output_file.write("\n")
+    # Write beside the target and swap it in, so readers never see a partial file.
+    tmp_path = out_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as output_file:
+            output_file.write(encode_json({"items": items}))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        # Don't leave a stray partial file behind in public/data.
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
     print(f"Wrote items.json with {total} leaf items")
 
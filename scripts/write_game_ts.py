@@ -46,6 +46,7 @@ export class Game extends Phaser.Scene {
   private shiftTimerX: number = 0;
   private shiftTimerY: number = 0;
   private readonly shiftTimerRadius: number = 12;
+  private lastShiftArcStep: number = -1;
 
   // ── Revenue ───────────────────────────────────────────────────────────────
   private shiftRevenue: number = 0;
@@ -90,9 +91,10 @@ export class Game extends Phaser.Scene {
       this.droneStage   = new DroneStage(this);
       this.reOrientMode = new ReOrientMode(this);
 
+      const itemsById = new Map<string, any>(items.map((it: any): [string, any] => [it.id, it]));
       this.buildPanelUI(gw, gh, dialY, dialR, items);
-      this.buildDial(items, dialX, dialY, dialR);
-      this.populateRepairPools(items);
+      this.buildDial(itemsById, dialX, dialY, dialR);
+      this.populateRepairPools(itemsById);
       this.wireDialEvents();
       this.events.once("shutdown", this.shutdown, this);
     } catch (e) {
@@ -101,13 +103,17 @@ export class Game extends Phaser.Scene {
     }
   }
 
-  update(): void {
+  update(time: number): void {
     if (!this.shiftArcGraphic) return;
     const s = this.shiftTimerState;
     if (s.shiftDurationMs <= 0) return;
-    const elapsed  = s.timerPaused ? (s.timerPausedAt - s.shiftStartTime) : (Date.now() - s.shiftStartTime);
+    const elapsed  = s.timerPaused ? (s.timerPausedAt - s.shiftStartTime) : (time - s.shiftStartTime);
     const fraction = Math.min(1, elapsed / s.shiftDurationMs);
     const r        = this.shiftTimerRadius;
+    // Only repaint once the arc has advanced by at least a pixel of circumference.
+    const step     = Math.floor(fraction * Math.ceil(2 * Math.PI * r));
+    if (step === this.lastShiftArcStep) return;
+    this.lastShiftArcStep = step;
     this.shiftArcGraphic.clear();
     if (fraction > 0) {
       this.shiftArcGraphic.fillStyle(0x00e84a, 0.85);
@@ -164,7 +170,8 @@ export class Game extends Phaser.Scene {
     this.shiftTimerY = titleY;
     const s      = this.shiftTimerState;
     s.shiftDurationMs = sm.getShiftDurationMs();
-    s.shiftStartTime  = Date.now();
+    s.shiftStartTime  = this.time.now;   // same clock as the time passed to update()
+    this.lastShiftArcStep = -1;
     const tBg = this.add.graphics();
     tBg.fillStyle(Colors.PANEL_MEDIUM, 1);
     tBg.fillCircle(timerX, titleY, timerR);
@@ -261,20 +268,20 @@ export class Game extends Phaser.Scene {
   // Dial
   // ══════════════════════════════════════════════════════════════════════════
 
-  private buildDial(items: any[], dialX: number, dialY: number, dialR: number): void {
+  private buildDial(itemsById: Map<string, any>, dialX: number, dialY: number, dialR: number): void {
     const cfg = this.cache.json.get('rad-dial') as RadDialConfig | undefined;
     let roots: MenuItem[];
 
     if (cfg) {
       roots = cfg.actions.map((a): MenuItem => {
         if (!a.enabled) return { id: `locked_${a.id}`, name: a.name, icon: a.icon, layers: a.layers };
-        const src = a.itemSource ? (items as any[]).find((it: any) => it.id === a.itemSource) : null;
+        const src = a.itemSource ? itemsById.get(a.itemSource) : null;
         return { id: a.id, name: a.name, icon: a.icon, layers: a.layers, children: src?.children ?? [] } as MenuItem;
       });
     } else {
       const p    = ProgressionManager.getInstance();
       const cats = p.getUnlockedCategories();
-      roots = cats.map(({ categoryId }) => (items as any[]).find((it: any) => it.id === categoryId) as MenuItem).filter(Boolean);
+      roots = cats.map(({ categoryId }) => itemsById.get(categoryId) as MenuItem).filter(Boolean);
       const needed = ALL_CATEGORY_IDS.length - roots.length;
       for (let i = 0; i < needed; i++) roots.push({ id: `locked_slot_${i}`, name: "LOCKED", icon: "skill-blocked" });
     }
@@ -294,18 +301,18 @@ export class Game extends Phaser.Scene {
     });
   }
 
-  private populateRepairPools(items: any[]): void {
+  private populateRepairPools(itemsById: Map<string, any>): void {
     const cfg = this.cache.json.get('rad-dial') as RadDialConfig | undefined;
     let pool: any[] = [];
     if (cfg) {
       const ra = cfg.actions.find(a => a.id === 'action_reorient');
       if (ra?.itemSource) {
-        const src = (items as any[]).find((it: any) => it.id === ra.itemSource);
+        const src = itemsById.get(ra.itemSource);
         if (src) pool = this.collectLeaves(src.children ?? []);
       }
     }
     if (pool.length === 0) {
-      const root = (items as any[]).find((it: any) => it.id === 'nav_resources_root');
+      const root = itemsById.get('nav_resources_root');
       if (root) pool = this.collectLeaves(root.children ?? []);
     }
     this.reOrientMode?.setPool(pool);
@@ -313,13 +320,20 @@ export class Game extends Phaser.Scene {
   }
 
   private collectLeaves(nodes: any[]): any[] {
-    const out: any[] = [];
-    const walk = (arr: any[]) => {
-      for (const n of arr) {
-        if (n.children?.length) walk(n.children); else out.push(n);
+    // Explicit stack (children pushed in reverse) keeps depth-first order
+    // without allocating a recursive closure per call.
+    const out: any[]   = [];
+    const stack: any[] = [];
+    for (let i = nodes.length - 1; i >= 0; i--) stack.push(nodes[i]);
+    while (stack.length) {
+      const n = stack.pop();
+      const children = n.children;
+      if (children?.length) {
+        for (let i = children.length - 1; i >= 0; i--) stack.push(children[i]);
+      } else {
+        out.push(n);
       }
-    };
-    walk(nodes);
+    }
     return out;
   }
 
@@ -480,7 +494,8 @@ export class Game extends Phaser.Scene {
         this.tweens.add({ targets: lbl, alpha: { from: 1, to: 0 }, duration: 800, delay: 350, ease: "Quad.easeIn",
           onComplete: () => { lbl.destroy(); flash.destroy(); this.loadNextOrder(GameManager.getInstance().getItems()); },
         });
-        [this.revenueText, this.bonusText].forEach(t => { if (!t) return; this.tweens.add({ targets: t, scaleX: { from: 1, to: 1.4 }, scaleY: { from: 1, to: 1.4 }, duration: 180, yoyo: true, ease: "Back.easeOut" }); });
+        const statTexts = this.revenueText && this.bonusText ? [this.revenueText, this.bonusText] : (this.revenueText ?? this.bonusText);
+        if (statTexts) this.tweens.add({ targets: statTexts, scaleX: { from: 1, to: 1.4 }, scaleY: { from: 1, to: 1.4 }, duration: 180, yoyo: true, ease: "Back.easeOut" });
       },
     });
   }
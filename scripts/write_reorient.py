@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
+import hashlib
 import os
 DEST = os.path.join(os.path.dirname(__file__), '..', 'src', 'game', 'repair', 'ReOrientMode.ts')
+# Held as bytes from import time. A bytes literal cannot carry the template's
+# non-ASCII comment characters (—, →, ≤, …), so the str literal is encoded once here.
 CONTENT = r"""import Phaser from 'phaser';
 import { MenuItem } from '../types/GameTypes';
 import { Colors } from '../constants/Colors';
@@ -141,8 +144,8 @@ export class ReOrientMode {
 
     const gridW = cols * cellSize;
     const gridH = rows * cellSize;
-    const originX = cx - gridW / 2 + cellSize / 2;
-    const originY = cy - gridH / 2 + cellSize / 2;
+    const originX = (cx - gridW / 2 + cellSize / 2) | 0;
+    const originY = (cy - gridH / 2 + cellSize / 2) | 0;
 
     for (let i = 0; i < chosen.length; i++) {
       const col = i % cols;
@@ -202,10 +205,10 @@ export class ReOrientMode {
     container: Phaser.GameObjects.Container,
     cx: number, cy: number, gridW: number, gridH: number,
   ): void {
-    const left  = cx - gridW / 2 - PAD;
-    const right = cx + gridW / 2 + PAD;
-    const top   = cy - gridH / 2 - PAD;
-    const bot   = cy + gridH / 2 + PAD;
+    const left  = (cx - gridW / 2 - PAD) | 0;
+    const right = (cx + gridW / 2 + PAD) | 0;
+    const top   = (cy - gridH / 2 - PAD) | 0;
+    const bot   = (cy + gridH / 2 + PAD) | 0;
 
     const g = this.scene.add.graphics();
     g.setDepth(8);
@@ -217,13 +220,14 @@ export class ReOrientMode {
       [left,  bot,   1, -1],
       [right, bot,  -1, -1],
     ];
+    // One path for all four corners — a single stroke submission.
+    g.beginPath();
     for (const [bx, by, dx, dy] of corners) {
-      g.beginPath();
       g.moveTo(bx + dx * ARM, by);
       g.lineTo(bx, by);
       g.lineTo(bx, by + dy * ARM);
-      g.strokePath();
     }
+    g.strokePath();
     container.add(g);
     this.bracketGraphics.push(g);
   }
@@ -239,7 +243,20 @@ export class ReOrientMode {
     this.currentRepairItem = null;
   }
 }
-"""
-with open(DEST, 'w') as fh:
-    fh.write(CONTENT)
-print(f"Written {len(CONTENT)} chars to {DEST}")
+""".encode('utf-8')
+
+# Re-running with an unchanged template is a no-op.
+try:
+    with open(DEST, 'rb') as fh:
+        unchanged = hashlib.blake2b(fh.read()).digest() == hashlib.blake2b(CONTENT).digest()
+except FileNotFoundError:
+    unchanged = False
+
+if unchanged:
+    print(f"{DEST} is up to date")
+else:
+    os.makedirs(os.path.dirname(DEST), exist_ok=True)
+    # Written as bytes: no newline translation, identical output on every platform.
+    with open(DEST, 'wb') as fh:
+        fh.write(CONTENT)
+    print(f"Written {len(CONTENT)} bytes to {DEST}")
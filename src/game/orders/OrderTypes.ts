@@ -1,3 +1,6 @@
+/** Evaluated state of a fulfillment slot, used to pick its colours. */
+export type SlotStatus = 'empty' | 'correct' | 'misplaced' | 'wrong';
+
 /**
  * A positional fulfillment slot in the (legacy) orders row.
  * Slots start empty (iconKey === null). Items are placed left-to-right.
@@ -9,8 +12,14 @@ export interface OrderSlot {
   x: number;
   y: number;
   size: number;
+  left: number;             // x - size / 2
+  top: number;              // y - size / 2
+  innerSize: number;        // icon display size (size - 8)
   slotBg: Phaser.GameObjects.Graphics;
   slotIcon: Phaser.GameObjects.Image | null;
+  slotIconKey: string | null;  // texture key slotIcon was created for
   badgeGraphic: Phaser.GameObjects.Graphics | null;
   badgeText: Phaser.GameObjects.Text | null;
+  /** State the slot was last drawn with; redraws are skipped while it matches. */
+  lastRender?: { status: SlotStatus; iconKey: string | null; placedQty: number };
 }
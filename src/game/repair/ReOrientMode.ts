@@ -7,8 +7,27 @@ import { DroneWireframe } from './DroneWireframe';
 import { IRepairTask, TaskBounds } from './IRepairTask';
 
 const ROT_OPTIONS = [30, 60, 90, 120, 135, 150, 180, 210, 240, 270, 300, 330];
+const ROT_N       = ROT_OPTIONS.length;
+/**
+ * [cols, rows] indexed by item count (≤ 8):
+ *   count ≤ 4  →  square  (cols = ceil(sqrt(count)), rows = ceil(count / cols))
+ *   count ≥ 5  →  2 rows  (cols = ceil(count / 2))
+ */
+const GRID_SHAPES: ReadonlyArray<readonly [number, number]> = [
+  [0, 0], [1, 1], [2, 1], [2, 2], [2, 2], [3, 2], [3, 2], [4, 2], [4, 2],
+];
 /** Icon key for the re-orient action badge shown on each repair item card. */
 const REORIENT_ACTION_ICON = 'skill-refresh';
+/** Most images kept for reuse — enough for one full arrangement (two per item). */
+const POOL_MAX = 16;
+
+type FrameState = 'idle' | 'solved' | 'failed';
+/** Ring style per item state: [colour, line width, alpha]. */
+const FRAME_STYLES: Record<FrameState, readonly [number, number, number]> = {
+  idle:   [Colors.BORDER_BLUE,      2, 0.8],
+  solved: [0x44ff88,                3, 1.0],
+  failed: [Colors.HIGHLIGHT_YELLOW, 2, 0.85],
+};
 
 /**
  * Re-Orient repair task.
@@ -23,26 +42,48 @@ const REORIENT_ACTION_ICON = 'skill-refresh';
  *   repair:allSolved  {}   (all items in this arrangement are done)
  */
 export class ReOrientMode implements IRepairTask {
+  /**
+   * Frame and icon Images retired by destroyItems. Any entry may come back as
+   * either a frame or an icon; buildArrangement resets texture, size and
+   * rotation for whichever role it takes. Each drone gets a fresh ReOrientMode, so the pool is shared
+   * across instances; entries whose scene has shut down are discarded when
+   * popped.
+   */
+  private static imagePool: Phaser.GameObjects.Image[] = [];
+  /** AssetLoader.textureExists results by key, valid for textureCacheOwner. */
+  private static textureExistsCache = new Map<string, boolean>();
+  private static textureCacheOwner: Phaser.Textures.TextureManager | null = null;
+
   private scene: Phaser.Scene;
   private repairItems: RepairItem[] = [];
+  /** repairItems grouped by iconKey — rebuilt with each arrangement. */
+  private byKey = new Map<string, RepairItem[]>();
   private currentRepairItem: RepairItem | null = null;
   private itemPool: any[] = [];
   private wireframe: DroneWireframe | null = null;
+  /** Mulberry32 state — drives item picks and rotations. */
+  private rngState: number;
 
-  constructor(scene: Phaser.Scene) {
+  /**
+   * @param seed  Fixes the RNG so arrangements are reproducible (tests, replays).
+   *              Omit for a random seed.
+   */
+  constructor(scene: Phaser.Scene, seed?: number) {
     this.scene = scene;
+    this.rngState = (seed ?? Math.random() * 0x100000000) >>> 0;
+    ReOrientMode.watchTextures(scene.textures);
   }
 
   // ── IRepairTask lifecycle ─────────────────────────────────────────────
 
   activate(): void {
-    this.scene.events.on('dial:repairRotated', this.onRotatedInternal, this);
-    this.scene.events.on('dial:repairSettled', this.onSettledInternal, this);
+    this.scene.events.on('dial:repairRotated', this.onRotatedInternal);
+    this.scene.events.on('dial:repairSettled', this.onSettledInternal);
   }
 
   deactivate(): void {
-    this.scene.events.off('dial:repairRotated', this.onRotatedInternal, this);
-    this.scene.events.off('dial:repairSettled', this.onSettledInternal, this);
+    this.scene.events.off('dial:repairRotated', this.onRotatedInternal);
+    this.scene.events.off('dial:repairSettled', this.onSettledInternal);
   }
 
   // ── IRepairTask data accessors ────────────────────────────────────────
@@ -69,13 +110,10 @@ export class ReOrientMode implements IRepairTask {
   }
 
   resolveItem(iconKey: string): void {
-    const item = this.repairItems.find(r => r.iconKey === iconKey && r.requiresReplace && !r.solved);
+    const item = this.byKey.get(iconKey)?.find(r => r.requiresReplace && !r.solved);
     if (!item) return;
     item.solved = true;
-    // Redraw frame in solved green
-    item.frameObj.clear();
-    item.frameObj.lineStyle(3, 0x44ff88, 1.0);
-    item.frameObj.strokeCircle(item.iconObj.x, item.iconObj.y, Math.round(item.iconObj.displayWidth / 2) + 2);
+    this.setFrameState(item, 'solved');
     this.scene.events.emit(this.isAllSolved() ? 'repair:allSolved' : 'repair:itemSolved');
   }
 
@@ -87,7 +125,10 @@ export class ReOrientMode implements IRepairTask {
    */
   onItemSelected(item: MenuItem): void {
     const iconKey = item.icon || item.id;
-    const match   = this.repairItems.find(r => r.iconKey === iconKey && !r.solved);
+    let match: RepairItem | undefined;
+    for (const r of this.byKey.get(iconKey) ?? []) {
+      if (!r.solved) { match = r; break; }
+    }
     if (!match) {
       this.scene.events.emit('repair:noMatch');
       return;
@@ -111,9 +152,7 @@ export class ReOrientMode implements IRepairTask {
   /**
    * Builds the icon grid at alpha 0. Call RepairPanel.materialize() once the drone arrives.
    *
-   * Layout:
-   *   count ≤ 4  →  square  (cols = ceil(sqrt(count)))
-   *   count ≥ 5  →  2 rows  (cols = ceil(count / 2))
+   * Layout: square up to 4 items, 2 rows from 5 — see GRID_SHAPES.
    */
   buildArrangement(
     container: Phaser.GameObjects.Container,
@@ -122,80 +161,98 @@ export class ReOrientMode implements IRepairTask {
     droneKey?: string,
   ): void {
     this.destroyItems();
-    if (this.itemPool.length === 0) return;
 
     const { cx, cy, w, h } = bounds;
 
-    const n      = Math.max(2, Math.min(count, 8));
-    const actual = Math.min(n, this.itemPool.length);
-    const chosen = [...this.itemPool].sort(() => Math.random() - 0.5).slice(0, actual);
+    // Cheap guards first, so degenerate panels never touch the pool.
+    const actual = Math.min(Math.max(2, Math.min(count | 0, 8)), this.itemPool.length);
+    if (actual <= 0) return;
 
     // ── Grid dimensions ──────────────────────────────────────────────────
-    let cols: number, rows: number;
-    if (actual <= 4) {
-      cols = Math.ceil(Math.sqrt(actual));
-      rows = Math.ceil(actual / cols);
-    } else {
-      cols = Math.ceil(actual / 2);
-      rows = 2;
-    }
+    const [cols, rows] = GRID_SHAPES[actual];
 
     const cellSize = Math.min(
       Math.floor((w - 20) / cols),
       Math.floor((h - 24) / rows),
       104,
     );
+    if (cellSize < 16) return; // too cramped to be useful
+
+    // Partial Fisher–Yates: only the first `actual` slots are shuffled, and
+    // the pool itself is never copied.
+    const pool    = this.itemPool;
+    const poolLen = pool.length;
+    const idxs    = new Uint32Array(poolLen);
+    for (let i = 0; i < poolLen; i++) idxs[i] = i;
+    const chosen: any[] = new Array(actual);
+    for (let i = 0; i < actual; i++) {
+      const j = i + ((this.rand() * (poolLen - i)) | 0);
+      const t = idxs[i]; idxs[i] = idxs[j]; idxs[j] = t;
+      chosen[i] = pool[idxs[i]];
+    }
+
     const iconSize = Math.round(cellSize * 0.88);
     const GAP      = 12;
     const cellStep = cellSize + GAP;
 
     const gridW   = (cols - 1) * cellStep + cellSize;
     const gridH   = (rows - 1) * cellStep + cellSize;
-    const originX = cx - gridW / 2 + cellSize / 2;
-    const originY = cy - gridH / 2 + cellSize / 2;
+    // Snap to whole pixels — cellStep is integral, so every cell centre is too
+    // and icons never land on sub-pixel positions.
+    const originX = (cx - gridW / 2 + cellSize / 2) | 0;
+    const originY = (cy - gridH / 2 + cellSize / 2) | 0;
 
     // ── Wireframe drone — added FIRST so it renders behind all items ────
     if (droneKey && this.scene.textures.exists(droneKey)) {
       this.wireframe = new DroneWireframe(this.scene, container, cx, cy, w, h, droneKey);
     }
 
-    for (let i = 0; i < chosen.length; i++) {
-      const col = i % cols;
-      const row = Math.floor(i / cols);
-      const vx  = originX + col * cellStep;
-      const vy  = originY + row * cellStep;
-
-      const startRot = ROT_OPTIONS[Math.floor(Math.random() * ROT_OPTIONS.length)];
-      let targetRot  = ROT_OPTIONS[Math.floor(Math.random() * ROT_OPTIONS.length)];
-      while (targetRot === startRot) targetRot = ROT_OPTIONS[Math.floor(Math.random() * ROT_OPTIONS.length)];
+    // ── Pass 1: numbers only — cell centres and rotations per item ──────
+    const xs      = new Int32Array(actual);
+    const ys      = new Int32Array(actual);
+    const starts  = new Int16Array(actual);
+    const targets = new Int16Array(actual);
+    for (let i = 0; i < actual; i++) {
+      xs[i] = originX + (i % cols) * cellStep;
+      ys[i] = originY + ((i / cols) | 0) * cellStep;
+      // Draw the target from the ROT_N - 1 options other than the start, so
+      // the two always differ without a re-roll loop.
+      const si = (this.rand() * ROT_N) | 0;
+      let ti   = (this.rand() * (ROT_N - 1)) | 0;
+      if (ti >= si) ti++;
+      starts[i]  = ROT_OPTIONS[si];
+      targets[i] = ROT_OPTIONS[ti];
+    }
 
-      const r = Math.round(iconSize / 2) + 2;
+    const r        = Math.round(iconSize / 2) + 2;
+    const badgeR   = Math.round(r * 0.56);
+    const badgeOff = r * 0.62;
+    const frameKey = this.frameTexture(r, 'idle');
 
-      const bgObj = this.scene.add.graphics();
-      bgObj.fillStyle(Colors.PANEL_DARK, 0.88);
-      bgObj.fillCircle(vx, vy, r + 1);
-      bgObj.setDepth(3).setAlpha(0);
-      container.add(bgObj);
+    // ── Pass 2: scene-graph objects ──────────────────────────────────────
+    for (let i = 0; i < actual; i++) {
+      const vx       = xs[i];
+      const vy       = ys[i];
+      const startRot = starts[i];
 
-      const frameG = this.scene.add.graphics();
-      frameG.lineStyle(2, Colors.BORDER_BLUE, 0.8);
-      frameG.strokeCircle(vx, vy, r);
-      frameG.setDepth(4).setAlpha(0);
-      container.add(frameG);
+      // Backing disc + ring: a pre-rendered texture shared by every item.
+      const frameObj = this.popImage(vx, vy)?.setTexture(frameKey).setScale(1).setAngle(0)
+        ?? this.scene.add.image(vx, vy, frameKey);
+      frameObj.setDepth(4).setAlpha(0);
+      container.add(frameObj);
 
       const iconKey: string = chosen[i].icon || chosen[i].id;
-      let iconObj: Phaser.GameObjects.Image;
-      if (AssetLoader.textureExists(this.scene, iconKey)) {
-        iconObj = AssetLoader.createImage(this.scene, vx, vy, iconKey);
-      } else {
-        iconObj = this.scene.add.image(vx, vy, '').setVisible(false);
-      }
-      iconObj.setAngle(startRot).setDisplaySize(iconSize, iconSize).setDepth(5).setAlpha(0);
+      const iconObj = this.acquireIcon(vx, vy, iconKey, this.textureExists(iconKey));
+      // Plain field writes — one transform update at render instead of a setter chain.
+      iconObj.rotation      = startRot * Math.PI / 180;
+      iconObj.displayWidth  = iconSize;
+      iconObj.displayHeight = iconSize;
+      iconObj.depth         = 5;
+      iconObj.alpha         = 0;
       container.add(iconObj);
 
-      const badgeR  = Math.round(r * 0.56);
-      const badgeCx = vx + r * 0.62;
-      const badgeCy = vy + r * 0.62;
+      const badgeCx = (vx + badgeOff) | 0;
+      const badgeCy = (vy + badgeOff) | 0;
 
       const badgeBg = this.scene.add.graphics();
       badgeBg.fillStyle(Colors.PANEL_DARK, 0.95);
@@ -206,7 +263,7 @@ export class ReOrientMode implements IRepairTask {
       container.add(badgeBg);
 
       let badgeIcon: Phaser.GameObjects.Image;
-      if (AssetLoader.textureExists(this.scene, REORIENT_ACTION_ICON)) {
+      if (this.textureExists(REORIENT_ACTION_ICON)) {
         badgeIcon = AssetLoader.createImage(this.scene, badgeCx, badgeCy, REORIENT_ACTION_ICON);
       } else {
         badgeIcon = this.scene.add.image(badgeCx, badgeCy, '').setVisible(false);
@@ -217,17 +274,22 @@ export class ReOrientMode implements IRepairTask {
       this.repairItems.push({
         iconKey,
         startRotationDeg: startRot,
-        targetRotationDeg: targetRot,
+        targetRotationDeg: targets[i],
         currentRotationDeg: startRot,
         solved: false,
         requiresReplace: false,
         iconObj,
-        frameObj: frameG,
-        bgObj,
+        frameObj,
         badgeBg,
         badgeIcon,
       });
     }
+
+    for (const ri of this.repairItems) {
+      let group = this.byKey.get(ri.iconKey);
+      if (!group) this.byKey.set(ri.iconKey, group = []);
+      group.push(ri);
+    }
   }
 
   destroy(): void {
@@ -235,45 +297,161 @@ export class ReOrientMode implements IRepairTask {
   }
 
   // ── Private dial event handlers (subscribed in activate) ─────────────
-
-  private onRotatedInternal(data: { rotation: number }): void {
-    if (!this.currentRepairItem) return;
-    this.currentRepairItem.currentRotationDeg = data.rotation;
-    this.currentRepairItem.iconObj.setAngle(data.rotation);
-  }
-
-  private onSettledInternal(data: { success: boolean }): void {
+  // Arrow fields: each instance owns one pre-bound function, so the listener
+  // needs no context argument and `off` matches it exactly.
+
+  private readonly onRotatedInternal = (data: { rotation: number }): void => {
+    const cur = this.currentRepairItem;
+    if (!cur) return;
+    const r = data.rotation;
+    // The dial repeats the same angle while held still — skip the transform write.
+    if (cur.currentRotationDeg === r) return;
+    cur.currentRotationDeg = r;
+    cur.iconObj.setAngle(r);
+  };
+
+  private readonly onSettledInternal = (data: { success: boolean }): void => {
     if (!this.currentRepairItem) return;
     if (data.success) {
       this.currentRepairItem.currentRotationDeg = 0;
       this.currentRepairItem.iconObj.setAngle(0);
       this.currentRepairItem.solved = true;
-      const { iconObj, frameObj } = this.currentRepairItem;
-      frameObj.clear();
-      frameObj.lineStyle(3, 0x44ff88, 1.0);
-      frameObj.strokeCircle(iconObj.x, iconObj.y, Math.round(iconObj.displayWidth / 2) + 2);
+      this.setFrameState(this.currentRepairItem, 'solved');
     } else {
       // Mark this item as requiring physical replacement.
       // RepairPanel will visually dim it and swap its badge.
       this.currentRepairItem.requiresReplace = true;
+      this.setFrameState(this.currentRepairItem, 'failed');
       this.scene.events.emit('repair:itemFailed', { iconKey: this.currentRepairItem.iconKey });
     }
     this.currentRepairItem = null;
     if (data.success) {
       this.scene.events.emit(this.isAllSolved() ? 'repair:allSolved' : 'repair:itemSolved');
     }
-  }
+  };
 
   // ── Private helpers ───────────────────────────────────────────────────
 
+  /** Mulberry32: uniform float in [0, 1). */
+  private rand(): number {
+    let t = this.rngState = (this.rngState + 0x6D2B79F5) | 0;
+    t = Math.imul(t ^ (t >>> 15), 1 | t);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  }
+
+  /**
+   * Key of the pre-rendered frame for radius `r` in `state` (dark backing
+   * disc plus ring), generating the texture on first use. Frames drawn as
+   * Images batch with the icons and are never re-tessellated.
+   */
+  private frameTexture(r: number, state: FrameState): string {
+    const key = `repair-frame-${state}-${r}`;
+    if (this.scene.textures.exists(key)) return key;
+    const [color, width, alpha] = FRAME_STYLES[state];
+    const c = r + 2;   // half-size: disc / ring outer edge plus a 1 px margin
+    const g = this.scene.make.graphics({}, false);
+    g.fillStyle(Colors.PANEL_DARK, 0.88);
+    g.fillCircle(c, c, r + 1);
+    g.lineStyle(width, color, alpha);
+    g.strokeCircle(c, c, r);
+    g.generateTexture(key, c * 2, c * 2);
+    g.destroy();
+    return key;
+  }
+
+  /** Points an item's frame at the texture for `state` — one texture swap. */
+  private setFrameState(item: RepairItem, state: FrameState): void {
+    const r = Math.round(item.iconObj.displayWidth / 2) + 2;
+    item.frameObj.setTexture(this.frameTexture(r, state));
+  }
+
+  /**
+   * Binds the textureExists cache to `textures`, dropping cached results
+   * whenever a texture is added or removed. The texture manager is game-wide,
+   * so this subscribes once rather than once per instance.
+   */
+  private static watchTextures(textures: Phaser.Textures.TextureManager): void {
+    if (ReOrientMode.textureCacheOwner === textures) return;
+    ReOrientMode.textureCacheOwner = textures;
+    ReOrientMode.textureExistsCache.clear();
+    const invalidate = () => ReOrientMode.textureExistsCache.clear();
+    textures.on('addtexture', invalidate);
+    textures.on('removetexture', invalidate);
+  }
+
+  /** Cached AssetLoader.textureExists. */
+  private textureExists(key: string): boolean {
+    const cache = ReOrientMode.textureExistsCache;
+    let exists = cache.get(key);
+    if (exists === undefined) {
+      exists = AssetLoader.textureExists(this.scene, key);
+      cache.set(key, exists);
+    }
+    return exists;
+  }
+
+  /** Pops a live Image from the pool, moved to (x, y) and visible; null if none. */
+  private popImage(x: number, y: number): Phaser.GameObjects.Image | null {
+    const pool = ReOrientMode.imagePool;
+    while (pool.length > 0) {
+      const img = pool.pop()!;
+      if (img.scene === this.scene) return img.setPosition(x, y).setVisible(true);
+    }
+    return null;
+  }
+
+  /**
+   * Reuses a pooled Image for `iconKey`, or creates one. Icons without a
+   * loaded texture stay hidden.
+   */
+  private acquireIcon(x: number, y: number, iconKey: string, exists: boolean): Phaser.GameObjects.Image {
+    const img = this.popImage(x, y);
+    if (!img) {
+      return exists
+        ? AssetLoader.createImage(this.scene, x, y, iconKey)
+        : this.scene.add.image(x, y, '').setVisible(false);
+    }
+    if (exists) {
+      const atlasKey = AssetLoader.getAtlasKey(iconKey);
+      if (atlasKey) {
+        img.setTexture(atlasKey, iconKey);
+      } else {
+        img.setTexture(iconKey);
+      }
+    }
+    return img.setVisible(exists);
+  }
+
+  /**
+   * Hides `img` and parks it in the pool for the next arrangement, detached
+   * from its container so it is re-appended in draw order on reuse. Destroys
+   * it instead once the pool is full.
+   */
+  private recycle(img: Phaser.GameObjects.Image): void {
+    const pool = ReOrientMode.imagePool;
+    if (pool.length >= POOL_MAX) {
+      img.destroy();
+      return;
+    }
+    this.scene.tweens.killTweensOf(img);
+    img.parentContainer?.remove(img);
+    img.setVisible(false);
+    pool.push(img);
+  }
+
   private destroyItems(): void {
-    for (const ri of this.repairItems) {
-      ri.iconObj.destroy(); ri.frameObj.destroy();
-      ri.bgObj.destroy(); ri.badgeBg.destroy(); ri.badgeIcon.destroy();
+    const items = this.repairItems;
+    for (let i = items.length - 1; i >= 0; i--) {
+      const ri = items[i];
+      this.recycle(ri.frameObj);
+      this.recycle(ri.iconObj);
+      ri.badgeBg.destroy(); ri.badgeIcon.destroy();
       ri.badgeRing?.destroy();
     }
     this.wireframe?.destroy();
-    this.repairItems       = [];
+    items.length = 0;
+    this.byKey.clear();
     this.wireframe         = null;
     this.currentRepairItem = null;
   }
@@ -14,9 +14,12 @@ export interface RepairItem {
    */
   requiresReplace: boolean;
   iconObj: Phaser.GameObjects.Image;
-  frameObj: Phaser.GameObjects.Graphics;
-  /** Dark-panel fill circle behind the icon — separates it from the wireframe bg. */
-  bgObj: Phaser.GameObjects.Graphics;
+  /**
+   * Dark-panel fill circle behind the icon (separates it from the wireframe bg)
+   * plus the ring around it — a shared pre-rendered texture, swapped per state
+   * (idle / solved / failed) by ReOrientMode.
+   */
+  frameObj: Phaser.GameObjects.Image;
   /** Small circular badge background in the bottom-right corner of each icon cell. */
   badgeBg: Phaser.GameObjects.Graphics;
   /** Action icon shown inside the badge (e.g. skill-refresh for re-orient). */
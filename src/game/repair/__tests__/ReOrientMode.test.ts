@@ -32,11 +32,13 @@ jest.mock('phaser', () => ({
 jest.mock('../../managers/AssetLoader', () => ({
   AssetLoader: {
     textureExists: jest.fn().mockReturnValue(false),
+    getAtlasKey: jest.fn().mockReturnValue(null),
     createImage: jest.fn(),
   },
 }));
 
 import { ReOrientMode } from '../ReOrientMode';
+import { AssetLoader } from '../../managers/AssetLoader';
 import { DroneWireframe } from '../DroneWireframe';
 import { DeliveryQueue } from '../DeliveryQueue';
 
@@ -87,6 +89,9 @@ function makeBehaviorScene() {
 
   const makeImg = () => ({
     setAngle: jest.fn().mockReturnThis(),
+    setTexture: jest.fn().mockReturnThis(),
+    setPosition: jest.fn().mockReturnThis(),
+    setScale: jest.fn().mockReturnThis(),
     setDisplaySize: jest.fn().mockReturnThis(),
     setDepth: jest.fn().mockReturnThis(),
     setAlpha: jest.fn().mockReturnThis(),
@@ -119,16 +124,20 @@ function makeBehaviorScene() {
       rectangle:  jest.fn().mockReturnValue({ setStrokeStyle: jest.fn().mockReturnThis(), destroy: jest.fn() }),
       container:  jest.fn().mockReturnValue({ add: jest.fn() }),
     },
-    textures: { exists: jest.fn().mockReturnValue(false) },
+    textures: { exists: jest.fn().mockReturnValue(false), on: jest.fn() },
     anims:    { exists: jest.fn().mockReturnValue(false), create: jest.fn() },
     time:     { delayedCall: jest.fn() },
-    tweens:   { add: jest.fn() },
+    tweens:   { add: jest.fn(), killTweensOf: jest.fn() },
     events,
     make: {
       graphics: jest.fn().mockReturnValue({
         clear: jest.fn().mockReturnThis(),
         fillStyle: jest.fn().mockReturnThis(),
         fillRect: jest.fn().mockReturnThis(),
+        fillCircle: jest.fn().mockReturnThis(),
+        lineStyle: jest.fn().mockReturnThis(),
+        strokeCircle: jest.fn().mockReturnThis(),
+        generateTexture: jest.fn().mockReturnThis(),
         createGeometryMask: jest.fn().mockReturnValue({}),
         destroy: jest.fn(),
       }),
@@ -305,6 +314,7 @@ describe('ReOrientMode.buildArrangement — wireframe pendingEdgeColor', () => {
       },
       textures: {
         exists: jest.fn().mockReturnValue(true),
+        on: jest.fn(),
       },
       anims: {
         exists: jest.fn().mockReturnValue(false),
@@ -326,6 +336,10 @@ describe('ReOrientMode.buildArrangement — wireframe pendingEdgeColor', () => {
           clear: jest.fn().mockReturnThis(),
           fillStyle: jest.fn().mockReturnThis(),
           fillRect: jest.fn().mockReturnThis(),
+          fillCircle: jest.fn().mockReturnThis(),
+          lineStyle: jest.fn().mockReturnThis(),
+          strokeCircle: jest.fn().mockReturnThis(),
+          generateTexture: jest.fn().mockReturnThis(),
           createGeometryMask: jest.fn().mockReturnValue({}),
           destroy: jest.fn(),
         }),
@@ -400,6 +414,15 @@ describe('ReOrientMode.buildArrangement — item initialisation', () => {
     expect(mode.getItems()).toHaveLength(1);
   });
 
+  it('draws each pool entry at most once', () => {
+    const { scene, container } = makeBehaviorScene();
+    const mode = new ReOrientMode(scene as any);
+    mode.setPool(['a', 'b', 'c', 'd', 'e', 'f'].map(id => ({ id, icon: `icon-${id}` })));
+    mode.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 6);
+    const keys = mode.getItems().map(item => item.iconKey);
+    expect(new Set(keys).size).toBe(6);
+  });
+
   it('produces distinct start and target rotation angles', () => {
     const { scene, container } = makeBehaviorScene();
     const mode = new ReOrientMode(scene as any);
@@ -410,6 +433,27 @@ describe('ReOrientMode.buildArrangement — item initialisation', () => {
     expect(item.currentRotationDeg).toBe(item.startRotationDeg);
   });
 
+  it('builds the same arrangement for the same seed', () => {
+    const pool = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i'].map(id => ({ id, icon: `icon-${id}` }));
+    const build = (seed: number) => {
+      const { scene, container } = makeBehaviorScene();
+      const mode = new ReOrientMode(scene as any, seed);
+      mode.setPool(pool);
+      mode.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 6);
+      return mode.getItems().map(item => [item.iconKey, item.startRotationDeg, item.targetRotationDeg]);
+    };
+    expect(build(1234)).toEqual(build(1234));
+  });
+
+  it('builds nothing when the panel is too cramped for usable cells', () => {
+    const { scene, container } = makeBehaviorScene();
+    const mode = new ReOrientMode(scene as any);
+    mode.setPool([{ id: 'a', icon: 'icon-a' }, { id: 'b', icon: 'icon-b' }]);
+    mode.buildArrangement(container as any, { cx: 20, cy: 20, w: 40, h: 40 }, 2);
+    expect(mode.getItems()).toEqual([]);
+    expect(container.add).not.toHaveBeenCalled();
+  });
+
   it('returns empty array before buildArrangement is called', () => {
     const { scene } = makeBehaviorScene();
     const mode = new ReOrientMode(scene as any);
@@ -418,6 +462,91 @@ describe('ReOrientMode.buildArrangement — item initialisation', () => {
   });
 });
 
+// ── ReOrientMode — frame / icon pooling ───────────────────────────────────
+
+describe('ReOrientMode — object pooling', () => {
+  it('reuses the previous arrangement\'s frames and icons instead of destroying them', () => {
+    const { scene, container } = makeBehaviorScene();
+    const pool = [{ id: 'a', icon: 'icon-a' }, { id: 'b', icon: 'icon-b' }];
+
+    const first = new ReOrientMode(scene as any);
+    first.setPool(pool);
+    first.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    const images = first.getItems().flatMap(ri => [ri.frameObj, ri.iconObj]);
+    // Real game objects carry their scene; pooled ones are only reused by it.
+    images.forEach(obj => { (obj as any).scene = scene; });
+    first.destroy();
+
+    const second = new ReOrientMode(scene as any);
+    second.setPool(pool);
+    second.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    const items = second.getItems();
+
+    images.forEach(img => {
+      expect(img.destroy).not.toHaveBeenCalled();
+      expect(items.some(ri => ri.frameObj === img || ri.iconObj === img)).toBe(true);
+    });
+  });
+
+  it('re-textures reused icons to their new key and shows them when the texture is loaded', () => {
+    const { scene, container } = makeBehaviorScene();
+    const exists   = AssetLoader.textureExists as jest.Mock;
+    const atlasKey = AssetLoader.getAtlasKey as jest.Mock;
+
+    const first = new ReOrientMode(scene as any);
+    first.setPool([{ id: 'a', icon: 'icon-a' }, { id: 'b', icon: 'icon-b' }]);
+    first.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    const pooled = first.getItems().flatMap(ri => [ri.frameObj, ri.iconObj]);
+    pooled.forEach(obj => { (obj as any).scene = scene; });
+    first.destroy();
+
+    // icon-c lives in an atlas, icon-d is a standalone texture.
+    exists.mockImplementation((_scene: unknown, key: string) => key === 'icon-c' || key === 'icon-d');
+    atlasKey.mockImplementation((key: string) => (key === 'icon-c' ? 'atlas-items' : null));
+    try {
+      const second = new ReOrientMode(scene as any);
+      second.setPool([{ id: 'c', icon: 'icon-c' }, { id: 'd', icon: 'icon-d' }]);
+      second.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+      const byKey = new Map(second.getItems().map(ri => [ri.iconKey, ri.iconObj as any]));
+
+      const atlasIcon = byKey.get('icon-c');
+      expect(pooled).toContain(atlasIcon);
+      expect(atlasIcon.setTexture).toHaveBeenLastCalledWith('atlas-items', 'icon-c');
+      expect(atlasIcon.setVisible).toHaveBeenLastCalledWith(true);
+
+      const plainIcon = byKey.get('icon-d');
+      expect(pooled).toContain(plainIcon);
+      expect(plainIcon.setTexture).toHaveBeenLastCalledWith('icon-d');
+      expect(plainIcon.setVisible).toHaveBeenLastCalledWith(true);
+    } finally {
+      exists.mockReturnValue(false);
+      atlasKey.mockReturnValue(null);
+    }
+  });
+});
+
+// ── ReOrientMode — texture lookup cache ───────────────────────────────────
+
+describe('ReOrientMode — textureExists cache', () => {
+  it('looks each key up once until the texture manager reports a change', () => {
+    const { scene, container } = makeBehaviorScene();
+    const lookup = AssetLoader.textureExists as jest.Mock;
+    const mode = new ReOrientMode(scene as any);
+    mode.setPool([{ id: 'a', icon: 'icon-a' }, { id: 'b', icon: 'icon-b' }]);
+    lookup.mockClear();
+
+    mode.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    mode.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    // icon-a, icon-b and the action badge icon
+    expect(lookup).toHaveBeenCalledTimes(3);
+
+    const [, onAdd] = scene.textures.on.mock.calls.find(([ev]) => ev === 'addtexture')!;
+    onAdd();
+    mode.buildArrangement(container as any, { cx: 100, cy: 100, w: 300, h: 200 }, 2);
+    expect(lookup).toHaveBeenCalledTimes(6);
+  });
+});
+
 // ── ReOrientMode — onItemSelected routing ─────────────────────────────────
 
 describe('ReOrientMode.onItemSelected', () => {
@@ -483,6 +612,14 @@ describe('ReOrientMode — successful repair settlement', () => {
     expect(firstOf(emittedEvents, 'repair:allSolved')).toBeUndefined();
   });
 
+  it('switches the frame to the solved texture on success', () => {
+    const { mode, events } = setupTwoItemMode();
+    const [item] = mode.getItems();
+    mode.onItemSelected({ id: item.iconKey, name: item.iconKey, icon: item.iconKey });
+    events.emit('dial:repairSettled', { success: true });
+    expect(item.frameObj.setTexture).toHaveBeenLastCalledWith(expect.stringMatching(/^repair-frame-solved-/));
+  });
+
   it('resets currentRotationDeg to 0 on success', () => {
     const { mode, events } = setupTwoItemMode();
     const [item] = mode.getItems();
@@ -524,6 +661,17 @@ describe('ReOrientMode — successful repair settlement', () => {
     expect(item.currentRotationDeg).toBe(90);
   });
 
+  it('dial:repairRotated skips setAngle when the rotation has not changed', () => {
+    const { mode, events } = setupTwoItemMode();
+    const [item] = mode.getItems();
+    mode.onItemSelected({ id: item.iconKey, name: item.iconKey, icon: item.iconKey });
+    (item.iconObj.setAngle as jest.Mock).mockClear();
+    // 45° is never a start angle, so the first event always counts as a change.
+    events.emit('dial:repairRotated', { rotation: 45 });
+    events.emit('dial:repairRotated', { rotation: 45 });
+    expect(item.iconObj.setAngle).toHaveBeenCalledTimes(1);
+  });
+
   it('dial:repairRotated is a no-op when no item is active', () => {
     const { mode, events } = setupTwoItemMode();
     const [item] = mode.getItems();
@@ -544,6 +692,7 @@ describe('ReOrientMode — failure settlement (requires replacement)', () => {
 
     expect(item.requiresReplace).toBe(true);
     expect(item.solved).toBe(false);
+    expect(item.frameObj.setTexture).toHaveBeenLastCalledWith(expect.stringMatching(/^repair-frame-failed-/));
     const ev = firstOf(emittedEvents, 'repair:itemFailed');
     expect(ev).toBeDefined();
     expect(ev!.data.iconKey).toBe(item.iconKey);
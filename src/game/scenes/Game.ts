@@ -9,7 +9,7 @@ import { labelStyle, readoutStyle } from "../constants/FontStyle";
 import { generateOrder as buildOrder } from "../utils/OrderUtils";
 import { MenuItem, Order } from "../types/GameTypes";
 import { RadDialConfig } from "../types/RadDialTypes";
-import { OrderSlot } from "../orders/OrderTypes";
+import { OrderSlot, SlotStatus } from "../orders/OrderTypes";
 import { RepairPanel } from "../ui/panels/RepairPanel";
 import { SettingsPanel } from "../ui/panels/SettingsPanel";
 import { CatalogPanel } from "../ui/panels/CatalogPanel";
@@ -42,6 +42,10 @@ export class Game extends Phaser.Scene {
   private ordersContainer:  Phaser.GameObjects.Container | null = null;
   private orderSlots:       OrderSlot[] = [];
   private currentOrder:     Order | null = null;
+  private reqIdxByIcon:     Map<string, number> = new Map();
+  private slotByIcon:       Map<string, number> = new Map();
+  private ordersPanel:      OrdersPanel | null = null;
+  private items:            any[] = [];
   private ordersPanelX:     number = 0;
   private ordersPanelWidth: number = 0;
   private ordersPanelTop:   number = 0;
@@ -66,6 +70,7 @@ export class Game extends Phaser.Scene {
       const dialX   = leftHanded ? -ds.offsetX : gw + ds.offsetX;
       const dialY   = gh + ds.offsetY;
       const dialR   = ds.radius ?? 150;
+      this.items    = GameManager.getInstance().getItems();
 
       this.droneStage   = new DroneStage(this);
       // Pre-select the drone key before buildPanelUI so spawn() and
@@ -130,8 +135,9 @@ export class Game extends Phaser.Scene {
     this.ordersPanelHeight = panelH;
 
     const order    = buildOrder(items);
-    this.currentOrder = order;
+    this.setCurrentOrder(order);
     const oPanel   = new OrdersPanel(this);
+    this.ordersPanel = oPanel;
     this.orderSlots = oPanel.build(this.ordersContainer!, panelX, panelTop + 10, panelW - 20, panelH - 20, order);
     this.ordersContainer!.setVisible(false);
 
@@ -173,14 +179,21 @@ export class Game extends Phaser.Scene {
       ? panelX - panelW / 2 - tabGap - tabW / 2
       : panelX + panelW / 2 + tabGap + tabW / 2;
     const tabStartY = panelTop + tabH / 2 + 4;
+    // One set of handlers shared by every tab; each button is passed as the
+    // listener context and carries its TabKey in its data manager.
+    type TabButton = Phaser.GameObjects.Rectangle;
+    const onTabDown = function (this: TabButton) { updateTab(this.getData("tab") as TabKey); };
+    const onTabOver = function (this: TabButton) { this.setFillStyle(Colors.BUTTON_HOVER, 0.95); };
+    const onTabOut  = function (this: TabButton) { this.setFillStyle(Colors.PANEL_DARK, 0.9); };
     tabKeys.forEach((label, i) => {
       const ty  = tabStartY + i * (tabH + tabSpc);
       const bg  = this.add.rectangle(tabX, ty, tabW, tabH, Colors.PANEL_DARK, 0.9);
       bg.setStrokeStyle(2, Colors.BORDER_BLUE, 0.8);
       bg.setInteractive();
-      bg.on("pointerdown", () => updateTab(label));
-      bg.on("pointerover", () => bg.setFillStyle(Colors.BUTTON_HOVER, 0.95));
-      bg.on("pointerout",  () => bg.setFillStyle(Colors.PANEL_DARK, 0.9));
+      bg.setData("tab", label);
+      bg.on("pointerdown", onTabDown, bg);
+      bg.on("pointerover", onTabOver, bg);
+      bg.on("pointerout",  onTabOut,  bg);
       this.add.text(tabX, ty, label[0], labelStyle(16, Colors.HIGHLIGHT_YELLOW)).setOrigin(0.5);
     });
   }
@@ -278,7 +291,8 @@ export class Game extends Phaser.Scene {
       }
       // Delivery path: show quantity terminal at the item's slice clock position.
       const iconKey    = data.item.icon || data.item.id;
-      const qty        = this.orderSlots.find(s => s.iconKey === iconKey)?.placedQty ?? 0;
+      const slotIdx    = this.slotByIcon.get(iconKey);
+      const qty        = slotIdx !== undefined ? this.orderSlots[slotIdx].placedQty : 0;
       const sliceAngle = data.sliceCenterAngle ?? Math.PI / 2;
       this.radialDial?.showTerminalDial(data.item, qty, sliceAngle);
       this.cornerHUD?.onItemConfirmed();
@@ -394,12 +408,12 @@ export class Game extends Phaser.Scene {
   // Order fulfillment (legacy, backgrounded)
   // ══════════════════════════════════════════════════════════════════════════
 
-  private evaluateSlot(i: number): 'empty' | 'correct' | 'misplaced' | 'wrong' {
+  private evaluateSlot(i: number): SlotStatus {
     const slot = this.orderSlots[i];
     if (!slot || slot.iconKey === null) return 'empty';
     if (!this.currentOrder) return 'wrong';
-    const idx = this.currentOrder.requirements.findIndex(r => r.iconKey === slot.iconKey);
-    if (idx === -1) return 'wrong';
+    const idx = this.reqIdxByIcon.get(slot.iconKey);
+    if (idx === undefined) return 'wrong';
     const req = this.currentOrder.requirements[idx];
     if (slot.placedQty !== req.quantity) return 'wrong';
     return idx === i ? 'correct' : 'misplaced';
@@ -409,7 +423,24 @@ export class Game extends Phaser.Scene {
     if (!this.ordersContainer) return;
     const slot = this.orderSlots[i];
     if (!slot) return;
-    const status = this.evaluateSlot(i);
+    this.drawSlot(slot, this.evaluateSlot(i));
+  }
+
+  /**
+   * Redraws slots in [lo, hi). All statuses are evaluated before any Graphics
+   * is touched, so the draw pass is a tight loop of render calls.
+   */
+  private redrawSlotsRange(lo: number, hi: number = this.orderSlots.length): void {
+    if (!this.ordersContainer) return;
+    const end = Math.min(hi, this.orderSlots.length);
+    const statuses: SlotStatus[] = [];
+    for (let i = lo; i < end; i++) statuses.push(this.evaluateSlot(i));
+    for (let i = lo; i < end; i++) this.drawSlot(this.orderSlots[i], statuses[i - lo]);
+  }
+
+  private drawSlot(slot: OrderSlot, status: SlotStatus): void {
+    const last = slot.lastRender;
+    if (last && last.status === status && last.iconKey === slot.iconKey && last.placedQty === slot.placedQty) return;
     slot.slotBg.clear();
     let bgFill: number; let bgStr: number; let strA: number;
     switch (status) {
@@ -419,21 +450,25 @@ export class Game extends Phaser.Scene {
       default:          bgFill = Colors.PANEL_MEDIUM; bgStr = Colors.BORDER_BLUE; strA = 0.7; break;
     }
     slot.slotBg.fillStyle(bgFill, 0.85);
-    slot.slotBg.fillRect(slot.x - slot.size / 2, slot.y - slot.size / 2, slot.size, slot.size);
+    slot.slotBg.fillRect(slot.left, slot.top, slot.size, slot.size);
     slot.slotBg.lineStyle(2, bgStr, strA);
-    slot.slotBg.strokeRect(slot.x - slot.size / 2, slot.y - slot.size / 2, slot.size, slot.size);
-    if (slot.slotIcon)     { slot.slotIcon.destroy();     slot.slotIcon = null; }
-    if (slot.iconKey && AssetLoader.textureExists(this, slot.iconKey)) {
+    slot.slotBg.strokeRect(slot.left, slot.top, slot.size, slot.size);
+    // Only rebuild the icon when the slot now holds a different texture.
+    if (slot.slotIcon && slot.slotIconKey !== slot.iconKey) {
+      slot.slotIcon.destroy(); slot.slotIcon = null; slot.slotIconKey = null;
+    }
+    if (!slot.slotIcon && slot.iconKey && AssetLoader.textureExists(this, slot.iconKey)) {
       slot.slotIcon = AssetLoader.createImage(this, slot.x, slot.y, slot.iconKey);
-      slot.slotIcon.setDisplaySize(slot.size - 8, slot.size - 8).setDepth(3);
+      slot.slotIcon.setDisplaySize(slot.innerSize, slot.innerSize).setDepth(3);
+      slot.slotIconKey = slot.iconKey;
       this.ordersContainer!.add(slot.slotIcon);
     }
     if (slot.badgeGraphic) { slot.badgeGraphic.destroy(); slot.badgeGraphic = null; }
     if (slot.badgeText)    { slot.badgeText.destroy();    slot.badgeText = null; }
     if (slot.iconKey !== null && slot.placedQty > 0) {
       const bR = 9;
-      const bX = slot.x + slot.size / 2 - bR + 2;
-      const bY = slot.y - slot.size / 2 + bR - 2;
+      const bX = slot.left + slot.size - bR + 2;
+      const bY = slot.top + bR - 2;
       const bC = status === 'correct' ? 0x00e84a : status === 'misplaced' ? 0xffd700 : status === 'wrong' ? 0xff2244 : Colors.NEON_BLUE;
       const bT = status === 'correct' ? 0x002200 : status === 'misplaced' ? 0x221100 : status === 'wrong' ? 0x330011 : 0x000033;
       const bg = this.add.graphics();
@@ -443,22 +478,32 @@ export class Game extends Phaser.Scene {
       this.ordersContainer!.add(txt);
       slot.badgeGraphic = bg; slot.badgeText = txt;
     }
+    slot.lastRender = { status, iconKey: slot.iconKey, placedQty: slot.placedQty };
   }
 
   private placeItem(iconKey: string, qty: number): void {
     if (!this.ordersContainer || !this.currentOrder) return;
-    const ei = this.orderSlots.findIndex(s => s.iconKey === iconKey);
+    const ei = this.slotByIcon.get(iconKey) ?? -1;
     if (qty === 0) {
       if (ei === -1) return;
-      for (let i = ei; i < this.orderSlots.length; i++) { const s = this.orderSlots[i]; if (s.slotIcon) { s.slotIcon.destroy(); s.slotIcon = null; } }
-      for (let i = ei; i < this.orderSlots.length - 1; i++) { this.orderSlots[i].iconKey = this.orderSlots[i + 1].iconKey; this.orderSlots[i].placedQty = this.orderSlots[i + 1].placedQty; }
+      // Icons travel left with their keys so drawSlot() can keep them instead of recreating.
+      this.orderSlots[ei].slotIcon?.destroy();
+      for (let i = ei; i < this.orderSlots.length - 1; i++) {
+        const s = this.orderSlots[i]; const next = this.orderSlots[i + 1];
+        s.iconKey = next.iconKey; s.placedQty = next.placedQty;
+        s.slotIcon = next.slotIcon?.setPosition(s.x, s.y) ?? null; s.slotIconKey = next.slotIconKey;
+      }
       const last = this.orderSlots[this.orderSlots.length - 1]; last.iconKey = null; last.placedQty = 0;
-      for (let i = ei; i < this.orderSlots.length; i++) this.redrawSlot(i);
+      last.slotIcon = null; last.slotIconKey = null;
+      this.slotByIcon.delete(iconKey);
+      for (let i = ei; i < this.orderSlots.length; i++) { const k = this.orderSlots[i].iconKey; if (k !== null) this.slotByIcon.set(k, i); }
+      this.redrawSlotsRange(ei);
     } else if (ei !== -1) {
       this.orderSlots[ei].placedQty = qty; this.redrawSlot(ei);
     } else {
-      const emp = this.orderSlots.findIndex(s => s.iconKey === null); if (emp === -1) return;
-      this.orderSlots[emp].iconKey = iconKey; this.orderSlots[emp].placedQty = qty; this.redrawSlot(emp);
+      // Slots are always packed leftward, so the first empty slot sits right after the filled ones.
+      const emp = this.slotByIcon.size; if (emp >= this.orderSlots.length) return;
+      this.orderSlots[emp].iconKey = iconKey; this.orderSlots[emp].placedQty = qty; this.slotByIcon.set(iconKey, emp); this.redrawSlot(emp);
     }
     this.switchToOrdersTab?.(); this.checkOrderComplete();
   }
@@ -466,7 +511,10 @@ export class Game extends Phaser.Scene {
   private checkOrderComplete(): void {
     if (!this.currentOrder) return;
     for (let i = 0; i < this.orderSlots.length; i++) { if (this.evaluateSlot(i) === 'wrong') return; }
-    const allMet = this.currentOrder.requirements.every(r => this.orderSlots.some(s => s.iconKey === r.iconKey && s.placedQty === r.quantity));
+    const allMet = this.currentOrder.requirements.every(r => {
+      const i = this.slotByIcon.get(r.iconKey);
+      return i !== undefined && this.orderSlots[i].placedQty === r.quantity;
+    });
     if (!allMet) return;
     this.switchToOrdersTab?.(); this.completeOrder();
   }
@@ -483,18 +531,24 @@ export class Game extends Phaser.Scene {
       onComplete: () => {
         const lbl = this.add.text(px, pt + ph / 2 - 10, 'ORDER ACCEPTED', readoutStyle(16, 0x00ff88)).setOrigin(0.5).setDepth(51);
         this.tweens.add({ targets: lbl, alpha: { from: 1, to: 0 }, duration: 800, delay: 350, ease: "Quad.easeIn",
-          onComplete: () => { lbl.destroy(); flash.destroy(); this.loadNextOrder(GameManager.getInstance().getItems()); },
+          onComplete: () => { lbl.destroy(); flash.destroy(); this.loadNextOrder(this.items); },
         });
       },
     });
   }
 
   private loadNextOrder(items: any[]): void {
-    this.ordersContainer?.removeAll(true);
-    this.orderSlots = [];
     this.radialDial?.reset();
-    this.currentOrder = buildOrder(items);
-    const p = new OrdersPanel(this);
-    this.orderSlots = p.build(this.ordersContainer!, this.ordersPanelX, this.ordersPanelTop + 10, this.ordersPanelWidth - 20, this.ordersPanelHeight - 20, this.currentOrder);
+    const order = buildOrder(items);
+    this.setCurrentOrder(order);
+    // Reuses the existing slot strip instead of tearing down the whole container.
+    this.orderSlots = this.ordersPanel?.rebind(order) ?? [];
+  }
+
+  /** Sets the active order and resets the icon-key lookups that track it. */
+  private setCurrentOrder(order: Order): void {
+    this.currentOrder = order;
+    this.reqIdxByIcon = new Map(order.requirements.map((r, i): [string, number] => [r.iconKey, i]));
+    this.slotByIcon.clear();
   }
 }
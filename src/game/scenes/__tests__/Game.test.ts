@@ -315,6 +315,88 @@ describe('Order row — leftward collapse algorithm', () => {
   });
 });
 
+describe('Order row — slotByIcon index', () => {
+  // Mirrors Game.placeItem, including its icon-key → slot-index map.
+  type Slot = { iconKey: string | null; placedQty: number };
+
+  function makeRow(n: number) {
+    const slots: Slot[] = Array.from({ length: n }, () => ({ iconKey: null, placedQty: 0 }));
+    return { slots, slotByIcon: new Map<string, number>() };
+  }
+
+  function place(row: ReturnType<typeof makeRow>, iconKey: string, qty: number): void {
+    const { slots, slotByIcon } = row;
+    const ei = slotByIcon.get(iconKey) ?? -1;
+    if (qty === 0) {
+      if (ei === -1) return;
+      for (let i = ei; i < slots.length - 1; i++) {
+        slots[i].iconKey = slots[i + 1].iconKey; slots[i].placedQty = slots[i + 1].placedQty;
+      }
+      slots[slots.length - 1].iconKey = null; slots[slots.length - 1].placedQty = 0;
+      slotByIcon.delete(iconKey);
+      for (let i = ei; i < slots.length; i++) { const k = slots[i].iconKey; if (k !== null) slotByIcon.set(k, i); }
+    } else if (ei !== -1) {
+      slots[ei].placedQty = qty;
+    } else {
+      const emp = slotByIcon.size; if (emp >= slots.length) return;
+      slots[emp].iconKey = iconKey; slots[emp].placedQty = qty; slotByIcon.set(iconKey, emp);
+    }
+  }
+
+  /** The map must agree with a linear scan of the slots. */
+  function expectIndexMatchesSlots(row: ReturnType<typeof makeRow>): void {
+    const scanned = new Map<string, number>();
+    row.slots.forEach((s, i) => { if (s.iconKey !== null) scanned.set(s.iconKey, i); });
+    expect(row.slotByIcon).toEqual(scanned);
+  }
+
+  it('re-indexes the shifted slots after a middle removal', () => {
+    const row = makeRow(4);
+    place(row, 'iron', 1); place(row, 'wood', 2); place(row, 'stone', 3);
+    place(row, 'wood', 0);
+    expect(row.slotByIcon.get('iron')).toBe(0);
+    expect(row.slotByIcon.get('stone')).toBe(1);
+    expect(row.slotByIcon.has('wood')).toBe(false);
+    expectIndexMatchesSlots(row);
+  });
+
+  it('places the next new item in the first empty slot after a removal', () => {
+    const row = makeRow(4);
+    place(row, 'iron', 1); place(row, 'wood', 2); place(row, 'stone', 3);
+    place(row, 'iron', 0);
+    const firstEmpty = row.slots.findIndex(s => s.iconKey === null);
+    expect(firstEmpty).toBe(row.slotByIcon.size);
+
+    place(row, 'copper', 4);
+    expect(row.slotByIcon.get('copper')).toBe(firstEmpty);
+    expect(row.slots[firstEmpty]).toEqual({ iconKey: 'copper', placedQty: 4 });
+    expectIndexMatchesSlots(row);
+  });
+
+  it('keeps the index consistent across mixed placements, updates and removals', () => {
+    const row = makeRow(5);
+    const ops: [string, number][] = [
+      ['a', 1], ['b', 1], ['c', 2], ['b', 0], ['d', 1], ['a', 3],
+      ['a', 0], ['e', 1], ['c', 0], ['f', 2], ['g', 1], ['h', 1],
+    ];
+    for (const [key, qty] of ops) {
+      place(row, key, qty);
+      expectIndexMatchesSlots(row);
+      // Slots stay packed leftward, so the map size is the first empty index.
+      const firstEmpty = row.slots.findIndex(s => s.iconKey === null);
+      expect(firstEmpty === -1 ? row.slots.length : firstEmpty).toBe(row.slotByIcon.size);
+    }
+  });
+
+  it('ignores a new item once every slot is filled', () => {
+    const row = makeRow(2);
+    place(row, 'iron', 1); place(row, 'wood', 1);
+    place(row, 'stone', 1);
+    expect(row.slotByIcon.has('stone')).toBe(false);
+    expectIndexMatchesSlots(row);
+  });
+});
+
 describe('Order row — completion check algorithm', () => {
   type Slot = { iconKey: string | null; placedQty: number };
   type Req  = { iconKey: string; quantity: number };
@@ -5,6 +5,9 @@ import { DialSettings } from '../managers/SettingsManager';
 const SLOT_SIZE   = 44;   // diameter of each circular slot
 const SLOT_GAP    = 8;    // vertical gap between slots
 const RING_WIDTH  = 4;
+const RING_R      = SLOT_SIZE / 2 + RING_WIDTH * 0.5 + 1;
+/** Progress steps per full ring — roughly one per pixel of circumference. */
+const RING_STEPS  = Math.ceil(2 * Math.PI * RING_R);
 const BOUNCE_AMP  = 5;    // pixels
 const BOUNCE_DUR  = 550;  // ms per half-cycle
 
@@ -17,6 +20,8 @@ interface DeliverySlot {
   ring:      Phaser.GameObjects.Graphics;
   tween:     Phaser.Tweens.Tween;
   startTime: number;
+  /** Progress step the ring was last drawn at; -1 until first drawn. */
+  lastStep:  number;
 }
 
 /**
@@ -98,6 +103,7 @@ export class DeliveryQueueUI {
     const slot: DeliverySlot = {
       iconKey, duration, container, bg, icon, ring, tween,
       startTime: this.scene.time.now,
+      lastStep:  -1,
     };
     this.slots.push(slot);
     this.repositionSlots();
@@ -140,6 +146,10 @@ export class DeliveryQueueUI {
     for (const slot of this.slots) {
       const elapsed  = now - slot.startTime;
       const progress = Math.min(1, elapsed / slot.duration);
+      // Skip the redraw until the arc has advanced by at least a pixel.
+      const step = Math.floor(progress * RING_STEPS);
+      if (step === slot.lastStep) continue;
+      slot.lastStep = step;
       slot.ring.clear();
       this.drawRing(slot.ring, progress);
     }
@@ -157,7 +167,7 @@ export class DeliveryQueueUI {
 
   private drawRing(g: Phaser.GameObjects.Graphics, progress: number): void {
     if (progress <= 0) return;
-    const r       = SLOT_SIZE / 2 + RING_WIDTH * 0.5 + 1;
+    const r       = RING_R;
     const endAngle = -Math.PI / 2 + progress * Math.PI * 2;
 
     // Track arc (dim)
@@ -12,6 +12,13 @@ import { OrderSlot } from '../../orders/OrderTypes';
 export class OrdersPanel {
   private scene: Phaser.Scene;
 
+  // ── State fields (set during build) ────────────────────────────────────
+  private container: Phaser.GameObjects.Container | null = null;
+  private bounds = { x: 0, y: 0, width: 0, height: 0 };
+  private slots:      OrderSlot[]                    = [];
+  private rowObjects: Phaser.GameObjects.GameObject[] = [];
+  private boxRowTop  = 0;
+
   constructor(scene: Phaser.Scene) {
     this.scene = scene;
   }
@@ -28,16 +35,54 @@ export class OrdersPanel {
     height: number,
     order: Order,
   ): OrderSlot[] {
-    const contentX   = x - width / 2 + 12;
-    const rightEdge  = x + width / 2 - 12;
     const contentBottom = y + height;
 
+    this.container  = container;
+    this.bounds     = { x, y, width, height };
+    this.rowObjects = [];
+
     const { slots, boxRowTop } = this.buildFulfillmentSlotRow(container, x, width, contentBottom, order.requirements);
-    this.buildOrderRequirementRows(container, x, width, boxRowTop, order, contentX, rightEdge);
+    this.slots     = slots;
+    this.boxRowTop = boxRowTop;
+    this.buildOrderRequirementRows(container, x, width, boxRowTop, order);
 
     return slots;
   }
 
+  /**
+   * Re-renders the panel for a new order, reusing the existing slot strip when
+   * the slot count is unchanged. Only the requirement rows are rebuilt; slots
+   * are emptied and their frames redrawn in place.
+   * @returns the (reset) fulfillment slots.
+   */
+  rebind(order: Order): OrderSlot[] {
+    const container = this.container;
+    if (!container) return [];
+    const { x, y, width, height } = this.bounds;
+
+    if (order.requirements.length !== this.slots.length) {
+      container.removeAll(true);
+      return this.build(container, x, y, width, height, order);
+    }
+
+    for (const obj of this.rowObjects) obj.destroy();
+    this.rowObjects = [];
+
+    for (const slot of this.slots) {
+      slot.iconKey   = null;
+      slot.placedQty = 0;
+      if (slot.slotIcon)     { slot.slotIcon.destroy();     slot.slotIcon = null; }
+      slot.slotIconKey = null;
+      if (slot.badgeGraphic) { slot.badgeGraphic.destroy(); slot.badgeGraphic = null; }
+      if (slot.badgeText)    { slot.badgeText.destroy();    slot.badgeText = null; }
+      slot.lastRender = undefined;
+      this.drawEmptySlot(slot.slotBg, slot.left, slot.top, slot.size);
+    }
+
+    this.buildOrderRequirementRows(container, x, width, this.boxRowTop, order);
+    return this.slots;
+  }
+
   // ── Private helpers ──────────────────────────────────────────────────────
 
   /**
@@ -77,11 +122,11 @@ export class OrdersPanel {
       const bx = boxStartX + i * (boxSize + boxGap) + boxSize / 2;
       const by = boxRowCenterY;
 
+      const left = bx - boxSize / 2;
+      const top  = by - boxSize / 2;
+
       const boxBg = this.scene.add.graphics();
-      boxBg.fillStyle(Colors.PANEL_MEDIUM, 0.8);
-      boxBg.fillRect(bx - boxSize / 2, by - boxSize / 2, boxSize, boxSize);
-      boxBg.lineStyle(1, Colors.BORDER_BLUE, 0.7);
-      boxBg.strokeRect(bx - boxSize / 2, by - boxSize / 2, boxSize, boxSize);
+      this.drawEmptySlot(boxBg, left, top, boxSize);
       container.add(boxBg);
 
       slots.push({
@@ -90,8 +135,12 @@ export class OrdersPanel {
         x: bx,
         y: by,
         size: boxSize,
+        left,
+        top,
+        innerSize: boxSize - 8,
         slotBg: boxBg,
         slotIcon: null,
+        slotIconKey: null,
         badgeGraphic: null,
         badgeText: null,
       });
@@ -105,16 +154,28 @@ export class OrdersPanel {
     return { slots, boxRowTop };
   }
 
-  /** Renders the scrollable item rows and total budget line above the drop-box strip. */
+  /** Draws the frame of an unfilled slot whose top-left corner is (left, top). */
+  private drawEmptySlot(g: Phaser.GameObjects.Graphics, left: number, top: number, size: number): void {
+    g.clear();
+    g.fillStyle(Colors.PANEL_MEDIUM, 0.8);
+    g.fillRect(left, top, size, size);
+    g.lineStyle(1, Colors.BORDER_BLUE, 0.7);
+    g.strokeRect(left, top, size, size);
+  }
+
+  /**
+   * Renders the scrollable item rows and total budget line above the drop-box strip.
+   * Every object created here is tracked in `rowObjects` so rebind() can drop them.
+   */
   private buildOrderRequirementRows(
     container: Phaser.GameObjects.Container,
     x: number,
     width: number,
     boxRowTop: number,
     order: Order,
-    contentX: number,
-    rightEdge: number,
   ): void {
+    const contentX        = x - width / 2 + 12;
+    const rightEdge       = x + width / 2 - 12;
     const rowHeight       = 48;
     const rowPadding      = 4;
     const fontSize        = 12;
@@ -124,31 +185,36 @@ export class OrdersPanel {
     const orderListHeight  = order.requirements.length * rowHeight + budgetLineHeight;
     const orderListTop     = (boxRowTop - 10) - orderListHeight;
 
+    const add = (obj: Phaser.GameObjects.GameObject) => {
+      container.add(obj);
+      this.rowObjects.push(obj);
+    };
+
     order.requirements.forEach((req, index) => {
       const rowTop = orderListTop + index * rowHeight;
 
       const rowBg = this.scene.add.graphics();
       rowBg.fillStyle(index % 2 === 0 ? 0x112244 : 0x0d1a35, 0.6);
       rowBg.fillRect(x - width / 2 + 4, rowTop + rowPadding / 2, width - 8, rowHeight - rowPadding);
-      container.add(rowBg);
+      add(rowBg);
 
       const nameLine1Y = rowTop + rowPadding + fontSize / 2 + 2;
       if (AssetLoader.textureExists(this.scene, 'hash-sign')) {
         const bullet = AssetLoader.createImage(this.scene, contentX + 4, nameLine1Y, 'hash-sign');
         bullet.setScale(0.45).setOrigin(0, 0.5).setTint(0xffffff);
-        container.add(bullet);
+        add(bullet);
       }
-      container.add(
+      add(
         this.scene.add.text(contentX + 22, nameLine1Y, req.itemName.toUpperCase(), labelStyle(fontSize))
           .setOrigin(0, 0.5).setWordWrapWidth(width - 36),
       );
 
       const detailY = nameLine1Y + fontSize + 4;
-      container.add(
+      add(
         this.scene.add.text(contentX + 16, detailY, `X${req.quantity}`, readoutStyle(qtyFontSize, 0xaaaacc))
           .setOrigin(0, 0.5),
       );
-      container.add(
+      add(
         this.scene.add.text(rightEdge, detailY, `Q${req.cost * req.quantity}`, readoutStyle(detailFontSize, Colors.HIGHLIGHT_YELLOW))
           .setOrigin(1, 0.5),
       );
@@ -160,7 +226,7 @@ export class OrdersPanel {
           x - width / 2 + 8, rowTop + rowHeight - rowPadding / 2,
           x + width / 2 - 8, rowTop + rowHeight - rowPadding / 2,
         );
-        container.add(sep);
+        add(sep);
       }
     });
 
@@ -168,13 +234,13 @@ export class OrdersPanel {
     const separatorLine = this.scene.add.graphics();
     separatorLine.lineStyle(1, Colors.BORDER_BLUE, 0.7);
     separatorLine.lineBetween(x - width / 2 + 8, budgetY, x + width / 2 - 8, budgetY);
-    container.add(separatorLine);
+    add(separatorLine);
 
-    container.add(
+    add(
       this.scene.add.text(contentX, budgetY + budgetLineHeight / 2, 'TOTAL BUDGET', labelStyle(fontSize))
         .setOrigin(0, 0.5),
     );
-    container.add(
+    add(
       this.scene.add.text(rightEdge, budgetY + budgetLineHeight / 2, `Q${order.budget}`, readoutStyle(fontSize + 1, Colors.HIGHLIGHT_YELLOW_BRIGHT))
         .setOrigin(1, 0.5),
     );
@@ -199,18 +199,20 @@ export class RepairPanel {
     const cL = 9;   // arm length
     const cI = 4;   // inset from outer corner
     bezelG.lineStyle(2, YEL, 0.75);
-    // top-left
-    bezelG.lineBetween(bL + cI, bTopY + cI, bL + cI + cL, bTopY + cI);
-    bezelG.lineBetween(bL + cI, bTopY + cI, bL + cI,      bTopY + cI + cL);
-    // top-right
-    bezelG.lineBetween(bR - cI, bTopY + cI, bR - cI - cL, bTopY + cI);
-    bezelG.lineBetween(bR - cI, bTopY + cI, bR - cI,      bTopY + cI + cL);
-    // bottom-left
-    bezelG.lineBetween(bL + cI, bottom + B - cI, bL + cI + cL, bottom + B - cI);
-    bezelG.lineBetween(bL + cI, bottom + B - cI, bL + cI,      bottom + B - cI - cL);
-    // bottom-right
-    bezelG.lineBetween(bR - cI, bottom + B - cI, bR - cI - cL, bottom + B - cI);
-    bezelG.lineBetween(bR - cI, bottom + B - cI, bR - cI,      bottom + B - cI - cL);
+    // All four brackets go into one path so they are stroked in a single pass.
+    const bracketCorners: Array<[number, number, number, number]> = [
+      [bL + cI, bTopY + cI,       1,  1],   // top-left
+      [bR - cI, bTopY + cI,      -1,  1],   // top-right
+      [bL + cI, bottom + B - cI,  1, -1],   // bottom-left
+      [bR - cI, bottom + B - cI, -1, -1],   // bottom-right
+    ];
+    bezelG.beginPath();
+    for (const [bx, by, dx, dy] of bracketCorners) {
+      bezelG.moveTo(bx + dx * cL, by);
+      bezelG.lineTo(bx, by);
+      bezelG.lineTo(bx, by + dy * cL);
+    }
+    bezelG.strokePath();
 
     // ── 5. Mid-rail centre notch — series of tick lines along the rail ────
     const mx = topLeft + width / 2;
@@ -229,7 +231,16 @@ export class RepairPanel {
     bezelG.fillCircle(rRX, divY - 5, rV);
     bezelG.fillCircle(rRX, divY + 5, rV);
 
-    container.add(bezelG);
+    // ── 7. Bake — the bezel never changes after build, so render it once into
+    // a texture instead of re-tessellating every stroke and fill each frame.
+    const bakeX = bL - 2;
+    const bakeY = bTopY - 2;
+    const bezelRT = this.scene.add.renderTexture(bakeX, bakeY, bW + 4, B * 2 + height + 4);
+    bezelRT.setOrigin(0, 0);
+    bezelRT.draw(bezelG, -bakeX, -bakeY);
+    bezelG.destroy();
+
+    container.add(bezelRT);
 
     this.scene.events.on('repair:itemFailed', this.onItemFailed, this);
   }
@@ -253,8 +264,8 @@ export class RepairPanel {
   }
 
   /**
-   * Called when `repair:itemFailed` fires.  Dims the icon, recolours the frame
-   * in warning amber, and swaps the badge to the replace (skill-recycle) icon.
+   * Called when `repair:itemFailed` fires.  Dims the icon and swaps the badge to
+   * the replace (skill-recycle) icon. ReOrientMode has already turned the frame amber.
    */
   private onItemFailed(data: { iconKey: string }): void {
     const items = this.activeSession?.task.getItems() ?? [];
@@ -269,16 +280,12 @@ export class RepairPanel {
       ease: 'Sine.easeIn',
     });
 
-    // Redraw frame in amber
-    ri.frameObj.clear();
-    ri.frameObj.lineStyle(2, Colors.HIGHLIGHT_YELLOW, 0.85);
     const r = Math.round(ri.iconObj.displayWidth / 2) + 2;
-    ri.frameObj.strokeCircle(ri.iconObj.x, ri.iconObj.y, r);
 
-    // Redraw badge bg in yellow
+    // Redraw badge bg in yellow, snapped like ReOrientMode so it stays centred on the badge icon
     const bR   = Math.round(r * 0.56);
-    const bCx  = ri.iconObj.x + r * 0.62;
-    const bCy  = ri.iconObj.y + r * 0.62;
+    const bCx  = (ri.iconObj.x + r * 0.62) | 0;
+    const bCy  = (ri.iconObj.y + r * 0.62) | 0;
     ri.badgeBg.clear();
     ri.badgeBg.fillStyle(Colors.PANEL_DARK, 0.95);
     ri.badgeBg.fillCircle(bCx, bCy, bR);
@@ -345,7 +352,7 @@ export class RepairPanel {
     const items     = this.activeSession.task.getItems();
     const wireframe = this.activeSession.task.getWireframe();
     wireframe?.reveal();
-    const targets = items.flatMap(ri => [ri.bgObj, ri.frameObj, ri.iconObj, ri.badgeBg, ri.badgeIcon]);
+    const targets = items.flatMap(ri => [ri.frameObj, ri.iconObj, ri.badgeBg, ri.badgeIcon]);
     targets.forEach((obj, i) => {
       this.scene.tweens.add({
         targets: obj,
@@ -371,7 +378,7 @@ export class RepairPanel {
     const wireframe = this.activeSession.task.getWireframe();
 
     const allObjs: Phaser.GameObjects.GameObject[] = [
-      ...items.flatMap(ri => [ri.bgObj, ri.frameObj, ri.iconObj, ri.badgeBg, ri.badgeIcon]),
+      ...items.flatMap(ri => [ri.frameObj, ri.iconObj, ri.badgeBg, ri.badgeIcon]),
       ...(wireframe?.sprite ? [wireframe.sprite] : []),
     ].reverse();
 
@@ -89,8 +89,7 @@ function makeRepairItem(iconKey = 'test-icon', hasBadgeRing = false) {
       displayWidth: 48,
       alpha: 1,
     },
-    frameObj:  graphicsMock(),
-    bgObj:     graphicsMock(),
+    frameObj:  { setTexture: jest.fn() },
     badgeBg:   graphicsMock(),
     badgeIcon: {
       setTexture: jest.fn(),
@@ -296,4 +295,17 @@ describe('RepairPanel.onItemFailed — badge ring', () => {
 
     expect(scene.add.graphics).not.toHaveBeenCalled();
   });
+
+  it('centres the badge background and ring on the whole-pixel badge centre', () => {
+    const { scene, gfxMock } = makeScene(false);
+    const panel = new RepairPanel(scene as any, {} as any);
+    const item = makeRepairItem('icon-ring5');
+    panel.setSession(makeSession([item]));
+
+    fireItemFailed(panel, 'icon-ring5');
+
+    // displayWidth 48 → r = 26 → offset 16.12, snapped down like ReOrientMode
+    expect(item.badgeBg.fillCircle).toHaveBeenCalledWith(116, 216, expect.any(Number));
+    expect(gfxMock.setPosition).toHaveBeenCalledWith(116, 216);
+  });
 });